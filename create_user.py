@@ -1,8 +1,9 @@
-from db import SessionLocal
+from db import SessionLocal, init_engine
 from models.user import User
 from utils.security import hash_password
 
 def create_user(username: str, raw_password: str, role: str = "user"):
+    init_engine()
     db = SessionLocal()
     try:
         hashed_pw = hash_password(raw_password)
@@ -1,5 +1,6 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.declarative import declarative_base
 from dotenv import load_dotenv
 import os
@@ -8,13 +9,64 @@ load_dotenv()
 
 DB_URL = f"postgresql+psycopg2://{os.getenv('DB_USER')}:{os.getenv('DB_PASS')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 
-engine = create_engine(DB_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Seconds to wait for a TCP connection before giving up, so an unreachable
+# host fails fast instead of hanging for the OS timeout
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", 3))
+# Per-process pool; each worker can hold up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+
+# The engine is created lazily (per process) so importing this module never
+# touches the database and forked workers don't share pooled connections.
+engine = None
+# Health checks use their own unpooled engine so they never queue behind requests
+probe_engine = None
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
+def init_engine():
+    global engine, probe_engine
+    if engine is None:
+        connect_args = {"connect_timeout": DB_CONNECT_TIMEOUT}
+        engine = create_engine(
+            DB_URL,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            connect_args=connect_args,
+        )
+        probe_engine = create_engine(DB_URL, poolclass=NullPool, connect_args=connect_args)
+        SessionLocal.configure(bind=engine)
+    return engine
+
+def get_engine():
+    # Unlike init_engine, never creates one; returns None before init and after dispose
+    return engine
+
+def warm_up():
+    # Open one pooled connection up front so the first request doesn't pay for it
+    with init_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+def ping():
+    if probe_engine is None:
+        raise RuntimeError("Database engine is not initialised")
+    with probe_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+def dispose_engine():
+    global engine, probe_engine
+    if engine is not None:
+        engine.dispose()
+        probe_engine.dispose()
+        engine = None
+        probe_engine = None
+        SessionLocal.configure(bind=None)
+
 # Dependency
 def get_db():
+    if engine is None:
+        raise RuntimeError("Database engine is not initialised; call db.init_engine() first")
     db = SessionLocal()
     try:
         yield db
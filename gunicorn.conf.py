@@ -0,0 +1,30 @@
+# Production server: gunicorn -c gunicorn.conf.py main:app
+# Run `python migrate.py` once before rolling out a new release.
+# Requires gunicorn >= 22, uvicorn-worker >= 0.2 and uvicorn >= 0.29 (the
+# drain handler in main.py depends on how uvicorn installs signal handlers).
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# Async workers each serve many requests, so one per CPU is enough. cpu_count()
+# sees the host, not a container's CPU quota: set WEB_CONCURRENCY there.
+# Connection budget: workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW), plus one per
+# in-flight health check, must stay below Postgres max_connections (100 by default).
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Import the app once in the master; each forked worker then only runs the
+# lifespan hook (its own engine + warm-up) instead of re-importing everything.
+# Because of this, HUP re-forks workers from the already-imported code: a new
+# release needs a full restart (or a USR2 binary upgrade), not a HUP.
+preload_app = True
+
+# Graceful drain: on SIGTERM each worker fails /health/ready, waits DRAIN_DELAY
+# seconds (see main.py), then finishes in-flight requests. The arbiter kills
+# workers graceful_timeout seconds after SIGTERM, so keep it above DRAIN_DELAY.
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("TIMEOUT", 60))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
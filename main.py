@@ -1,12 +1,60 @@
+import asyncio
+import logging
+import os
+import signal
+import threading
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from db import Base, engine
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from db import init_engine, get_engine, warm_up, ping, dispose_engine
 from routes import auth, threats
 
-app = FastAPI(title="Threat Intelligence API")
+logger = logging.getLogger("uvicorn.error")
 
-Base.metadata.create_all(bind=engine)
+# Seconds to keep serving (with /health/ready failing) after SIGTERM before
+# handing the signal on to uvicorn, so the load balancer can deregister us.
+DRAIN_DELAY = float(os.getenv("DRAIN_DELAY", 0))
+
+def install_drain_handler(app: FastAPI):
+    # Relies on uvicorn >= 0.29, which installs its handlers with signal.signal
+    # before lifespan startup. Wrapping uvicorn's SIGTERM handler flips readiness
+    # the moment the signal arrives, while the server is still accepting
+    # connections. SIGINT (Ctrl+C) is left alone so the dev server stops at once.
+    # Signals can only be handled on the main thread (not e.g. under TestClient);
+    # there, use an orchestrator preStop sleep instead.
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+    if not callable(previous):
+        return
+    loop = asyncio.get_running_loop()
+
+    def handle(signum, frame):
+        app.state.draining = True
+        loop.call_soon_threadsafe(loop.call_later, DRAIN_DELAY, previous, signum, frame)
+
+    signal.signal(signal.SIGTERM, handle)
+
+# Schema changes are applied separately with `python migrate.py`, so starting
+# a worker only opens its own connection pool.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.draining = False
+    install_drain_handler(app)
+    init_engine()
+    try:
+        # Off the event loop, and bounded by DB_CONNECT_TIMEOUT
+        await run_in_threadpool(warm_up)
+    except Exception:
+        # Keep the worker up; /health/ready reports 503 until the database is back
+        logger.exception("Database warm-up failed")
+    yield
+    dispose_engine()
+
+app = FastAPI(title="Threat Intelligence API", lifespan=lifespan)
 
 app.include_router(auth.router, prefix="/auth")
 app.include_router(threats.router)
@@ -27,5 +75,21 @@ app.add_middleware(
 async def root():
     return {"message": "Welcome to the Threat Intelligence API"}
 
+@app.get("/health/live")
+async def liveness():
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+def readiness():
+    if getattr(app.state, "draining", False):
+        return JSONResponse(status_code=503, content={"status": "draining"})
+    if get_engine() is None:
+        return JSONResponse(status_code=503, content={"status": "stopped"})
+    try:
+        ping()
+    except Exception:
+        return JSONResponse(status_code=503, content={"status": "database unavailable"})
+    return {"status": "ready"}
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
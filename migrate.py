@@ -0,0 +1,13 @@
+# Creates any tables that don't exist yet. This is not a real migration tool:
+# create_all never alters or drops existing tables, so column changes still
+# have to be applied by hand.
+import models
+import models.user
+from db import Base, init_engine
+
+def migrate():
+    Base.metadata.create_all(bind=init_engine())
+    print("Created missing tables.")
+
+if __name__ == "__main__":
+    migrate()
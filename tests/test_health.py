@@ -0,0 +1,102 @@
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+import db
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # No database here: stub out the two places that would open a connection
+    monkeypatch.setattr(main, "warm_up", lambda: None)
+    monkeypatch.setattr(main, "ping", lambda: None)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_import_does_not_create_engine():
+    # Fresh interpreter, so earlier tests that ran the lifespan don't interfere
+    code = "import main, db; assert db.get_engine() is None"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+def test_liveness(client):
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_readiness_ready(client):
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def test_readiness_database_down(client, monkeypatch):
+    def fail():
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(main, "ping", fail)
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "database unavailable"}
+
+
+def test_readiness_draining(client):
+    main.app.state.draining = True
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "draining"}
+
+
+def test_readiness_stopped(monkeypatch):
+    monkeypatch.setattr(main, "warm_up", lambda: None)
+    with TestClient(main.app):
+        pass
+    response = main.readiness()
+    assert response.status_code == 503
+    assert db.get_engine() is None
+
+
+def test_warm_up_failure_keeps_app_up(monkeypatch):
+    def fail():
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(main, "warm_up", fail)
+    monkeypatch.setattr(main, "ping", fail)
+    with TestClient(main.app) as client:
+        assert client.get("/health/live").status_code == 200
+        assert client.get("/health/ready").status_code == 503
+
+
+def test_get_db_without_engine_fails_fast():
+    with pytest.raises(RuntimeError, match="not initialised"):
+        next(db.get_db())
+
+
+def test_sigterm_sets_draining_then_chains(monkeypatch):
+    monkeypatch.setattr(main, "DRAIN_DELAY", 0.05)
+    received = []
+    original = signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+
+    async def run():
+        main.app.state.draining = False
+        main.install_drain_handler(main.app)
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0)
+        assert main.app.state.draining is True
+        assert received == []
+        await asyncio.sleep(0.1)
+        assert received == [signal.SIGTERM]
+
+    try:
+        asyncio.run(run())
+    finally:
+        signal.signal(signal.SIGTERM, original)